@@ -1,7 +1,9 @@
 """Environment lifecycle management."""
 
+import asyncio
 import os
 import shutil
+from functools import partial
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
@@ -17,6 +19,7 @@ from mcp_local_dev.sandboxes.sandbox import (
 )
 from mcp_local_dev.sandboxes.git import clone_github_repository
 from mcp_local_dev.test_runners.runners import detect_and_run_tests
+from mcp_local_dev.utils.files import link_or_copy
 from mcp_local_dev.logging import get_logger
 
 logger = get_logger(__name__)
@@ -32,18 +35,27 @@ async def create_environment_from_github(
     staging = await create_sandbox("mcp-staging-")
     try:
         repo = await clone_github_repository(staging, github_url, branch)
-        env = await create_environment_from_path(repo)
+        env = await create_environment_from_path(repo, link_files=True)
         return env
     finally:
-        cleanup_sandbox(staging)
+        await asyncio.to_thread(cleanup_sandbox, staging)
 
 
-async def create_environment_from_path(path: Path) -> Environment:
-    """Create new environment from filesystem path."""
+async def create_environment_from_path(
+    path: Path, link_files: bool = False
+) -> Environment:
+    """Create new environment from filesystem path, hard-linking files when the source is disposable."""
     env_id = b58_fuuid()
     sandbox = await create_sandbox(f"mcp-{env_id}-")
 
-    shutil.copytree(path, sandbox.work_dir, dirs_exist_ok=True)
+    shutil.copytree(
+        path,
+        sandbox.work_dir,
+        dirs_exist_ok=True,
+        copy_function=(
+            partial(link_or_copy, root=os.path.realpath(path)) if link_files else shutil.copy2
+        ),
+    )
     os.chmod(sandbox.work_dir, 0o700)
     os.chmod(sandbox.bin_dir, 0o700)
 
@@ -77,6 +89,19 @@ def get_environment(env_id: str) -> Optional[Environment]:
 
 def cleanup_environment(env: Environment) -> None:
     """Clean up environment and its resources."""
-    if env.id in _ENVIRONMENTS:
-        del _ENVIRONMENTS[env.id]
+    _ENVIRONMENTS.pop(env.id, None)
     cleanup_sandbox(env.sandbox)
+
+
+async def cleanup_all_environments() -> None:
+    """Clean up every registered environment, removing their sandboxes concurrently."""
+    envs = list(_ENVIRONMENTS.values())
+    results = await asyncio.gather(
+        *(asyncio.to_thread(cleanup_environment, env) for env in envs),
+        return_exceptions=True,
+    )
+    for env, result in zip(envs, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                {"event": "environment_cleanup_failed", "env_id": env.id, "error": str(result)}
+            )
@@ -1,10 +1,16 @@
 """Logging configuration and test output formatting."""
 
-import json
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from json.encoder import encode_basestring
+from time import localtime, strftime
 from typing import Any, Dict
 
+from mcp_local_dev.utils.serialization import encode_json
+
 # Don't modify root logger - MCP server uses it for stdout
 root = logging.getLogger()
 root.handlers = []
@@ -22,51 +28,79 @@ class ColorCodes:
 
 
 LEVEL_COLORS = {
-    "DEBUG": ColorCodes.BLUE,
-    "INFO": ColorCodes.GREEN,
-    "WARNING": ColorCodes.YELLOW,
-    "ERROR": ColorCodes.RED + ColorCodes.BOLD,
-    "CRITICAL": ColorCodes.MAGENTA + ColorCodes.BOLD,
+    logging.DEBUG: ColorCodes.BLUE,
+    logging.INFO: ColorCodes.GREEN,
+    logging.WARNING: ColorCodes.YELLOW,
+    logging.ERROR: ColorCodes.RED + ColorCodes.BOLD,
+    logging.CRITICAL: ColorCodes.MAGENTA + ColorCodes.BOLD,
 }
 
 
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def format_timestamp(created: float) -> str:
+    """Format a record creation time, reusing the formatted date and time for records within the same second."""
+    global _timestamp_cache
+    seconds = int(created)
+    cached_seconds, cached_ts = _timestamp_cache
+    if seconds != cached_seconds:
+        cached_ts = strftime("%Y-%m-%d %H:%M:%S", localtime(seconds))
+        _timestamp_cache = (seconds, cached_ts)
+    return f"{cached_ts},{int((created - seconds) * 1000):03d}"
+
+
 class JsonFormatter(logging.Formatter):
     """Format log records as color-coded JSON."""
 
-    def format(self, record: logging.LogRecord) -> str:
-        color = LEVEL_COLORS.get(record.levelname, "")
+    def __init__(self, colors: bool = True):
+        super().__init__()
+        self.level_colors = LEVEL_COLORS if colors else {}
+        self.reset = ColorCodes.RESET if colors else ""
 
-        output = {
-            "ts": self.formatTime(record),
-            "level": record.levelname,
-            "module": record.module,
-            "func": record.funcName,
-            "line": record.lineno,
-            "msg": record.getMessage(),
-        }
+    def format(self, record: logging.LogRecord) -> str:
+        color = self.level_colors.get(record.levelno, "")
+        func = "null" if record.funcName is None else encode_basestring(record.funcName)
+
+        json_str = (
+            f'{{"ts":"{format_timestamp(record.created)}",'
+            f'"level":{encode_basestring(record.levelname)},'
+            f'"module":{encode_basestring(record.module)},'
+            f'"func":{func},'
+            f'"line":{record.lineno},'
+            f'"msg":{encode_basestring(record.getMessage())}'
+        )
 
-        if hasattr(record, "data"):
-            output["data"] = record.data
+        data = record.__dict__.get("data")
+        if data is not None:
+            json_str = f'{json_str},"data":{encode_json(data)}'
 
-        json_str = json.dumps(output)
-        return f"{color}{json_str}{ColorCodes.RESET}"
+        return f"{color}{json_str}}}{self.reset}"
 
 
 def configure_logging():
-    """Set up application logging with JSON formatting."""
-    # Get the root logger for mcp_local_dev
+    """Set up application logging with JSON formatting on a background writer thread."""
     app_logger = logging.getLogger("mcp_local_dev")
-    
-    # Only configure if not already configured
+
     if not app_logger.handlers:
-        # Create and configure new handler
         handler = logging.StreamHandler(sys.stderr)
-        handler.setFormatter(JsonFormatter())
+        handler.setFormatter(JsonFormatter(colors=sys.stderr.isatty()))
         handler.setLevel(logging.DEBUG)
-        
-        # Configure logger
+
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        logging.logAsyncioTasks = False
+
         app_logger.setLevel(logging.DEBUG)
-        app_logger.addHandler(handler)
+        app_logger.addHandler(logging.handlers.QueueHandler(log_queue))
         app_logger.propagate = False
 
 
@@ -79,10 +113,22 @@ def log_with_data(
     logger: logging.Logger, level: int, msg: str, data: Dict[str, Any] = None
 ):
     """Log a message with optional structured data."""
+    if not logger.isEnabledFor(level):
+        return
     if data:
+        caller = sys._getframe(1)
+        code = caller.f_code
         record = logger.makeRecord(
-            logger.name, level, "(unknown)", 0, msg, (), None, extra={"data": data}
+            logger.name,
+            level,
+            code.co_filename,
+            caller.f_lineno,
+            msg,
+            (),
+            None,
+            func=code.co_name,
+            extra={"data": data},
         )
         logger.handle(record)
     else:
-        logger.log(level, msg)
+        logger.log(level, msg, stacklevel=2)
@@ -1,11 +1,10 @@
 """Bun runtime implementation."""
 
-import shutil
 from pathlib import Path
 
 from mcp_local_dev.types import Runtime, PackageManager, RuntimeConfig, Sandbox
 from mcp_local_dev.sandboxes.commands import install_packages
-from mcp_local_dev.sandboxes.sandbox import add_package_manager_bin_path
+from mcp_local_dev.sandboxes.sandbox import add_package_manager_bin_path, find_host_binary
 
 CONFIG = RuntimeConfig(
     name=Runtime.BUN,
@@ -18,11 +17,11 @@ CONFIG = RuntimeConfig(
 async def setup_bun(sandbox: Sandbox) -> None:
     """Set up Bun runtime environment."""
     # Verify and symlink bun
-    bun_path = shutil.which('bun')
+    bun_path = find_host_binary('bun')
     if not bun_path:
         raise RuntimeError("Required runtime/package manager not found: bun")
 
-    bunx_path = shutil.which('bunx')
+    bunx_path = find_host_binary('bunx')
     if not bunx_path:
         raise RuntimeError("Required package manager not found: bunx")
 
@@ -42,8 +41,7 @@ async def setup_bun(sandbox: Sandbox) -> None:
         node_target.symlink_to(bun_path)
 
     # Set up environment variables
-    for key, value in CONFIG.env_setup.items():
-        sandbox.env_vars[key] = value
+    sandbox.env_vars.update(CONFIG.env_setup)
 
     # Add package manager bin paths before installing packages
     add_package_manager_bin_path(sandbox, CONFIG.package_manager)
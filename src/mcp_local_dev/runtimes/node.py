@@ -1,11 +1,10 @@
 """Node runtime implementation."""
 
-import shutil
 from pathlib import Path
 
 from mcp_local_dev.types import Runtime, PackageManager, RuntimeConfig, Sandbox
 from mcp_local_dev.sandboxes.commands import install_packages
-from mcp_local_dev.sandboxes.sandbox import add_package_manager_bin_path
+from mcp_local_dev.sandboxes.sandbox import add_package_manager_bin_path, find_host_binary
 
 CONFIG = RuntimeConfig(
     name=Runtime.NODE,
@@ -18,11 +17,11 @@ CONFIG = RuntimeConfig(
 async def setup_node(sandbox: Sandbox) -> None:
     """Set up Node runtime environment."""
     # Verify and symlink node and npm
-    node_path = shutil.which('node')
+    node_path = find_host_binary('node')
     if not node_path:
         raise RuntimeError("Required runtime not found: node")
 
-    npm_path = shutil.which('npm')
+    npm_path = find_host_binary('npm')
     if not npm_path:
         raise RuntimeError("Required package manager not found: npm")
 
@@ -36,7 +35,7 @@ async def setup_node(sandbox: Sandbox) -> None:
     if not npm_target.exists():
         npm_target.symlink_to(npm_path)
 
-    npx_path = shutil.which('npx')
+    npx_path = find_host_binary('npx')
     if not npx_path:
         raise RuntimeError("Required package manager not found: npx")
 
@@ -45,8 +44,7 @@ async def setup_node(sandbox: Sandbox) -> None:
         npx_target.symlink_to(npx_path)
 
     # Set up environment variables
-    for key, value in CONFIG.env_setup.items():
-        sandbox.env_vars[key] = value
+    sandbox.env_vars.update(CONFIG.env_setup)
 
     # Add package manager bin paths before installing packages
     add_package_manager_bin_path(sandbox, CONFIG.package_manager)
@@ -1,12 +1,11 @@
 """Python runtime implementation."""
 
-import shutil
 from pathlib import Path
 from typing import List
 
 from mcp_local_dev.types import Runtime, PackageManager, RuntimeConfig, Sandbox
 from mcp_local_dev.sandboxes.commands import install_packages
-from mcp_local_dev.sandboxes.sandbox import add_package_manager_bin_path
+from mcp_local_dev.sandboxes.sandbox import add_package_manager_bin_path, find_host_binary
 
 CONFIG = RuntimeConfig(
     name=Runtime.PYTHON,
@@ -22,7 +21,7 @@ CONFIG = RuntimeConfig(
 async def setup_python(sandbox: Sandbox) -> None:
     """Set up Python runtime environment."""
     # Verify and symlink uv
-    uv_path = shutil.which('uv')
+    uv_path = find_host_binary('uv')
     if not uv_path:
         raise RuntimeError("Required package manager not found: uv")
 
@@ -31,8 +30,7 @@ async def setup_python(sandbox: Sandbox) -> None:
         target.symlink_to(uv_path)
 
     # Set up environment variables
-    for key, value in CONFIG.env_setup.items():
-        sandbox.env_vars[key] = value
+    sandbox.env_vars.update(CONFIG.env_setup)
 
     # Add package manager bin paths before installing packages
     add_package_manager_bin_path(sandbox, CONFIG.package_manager)
@@ -1,9 +1,11 @@
 """Runtime detection and configuration."""
 
-from typing import Dict, Callable, Awaitable
+import os
+from typing import Dict, Callable, Awaitable, Iterable, Optional
 from mcp_local_dev.types import Runtime, RuntimeConfig, Sandbox
 from mcp_local_dev.logging import get_logger
 from mcp_local_dev.runtimes import python, node, bun
+from mcp_local_dev.utils.files import walk_project_files
 
 logger = get_logger(__name__)
 
@@ -14,6 +16,14 @@ RUNTIME_CONFIGS: Dict[Runtime, RuntimeConfig] = {
     Runtime.BUN: bun.CONFIG,
 }
 
+CONFIG_FILE_RUNTIMES: Dict[str, frozenset[Runtime]] = {
+    name: frozenset(
+        runtime for runtime, config in RUNTIME_CONFIGS.items() if name in config.config_files
+    )
+    for config in RUNTIME_CONFIGS.values()
+    for name in config.config_files
+}
+
 # Map of runtime setup functions
 RUNTIME_SETUP: Dict[Runtime, Callable[[Sandbox], Awaitable[None]]] = {
     Runtime.PYTHON: python.setup_python,
@@ -21,23 +31,28 @@ RUNTIME_SETUP: Dict[Runtime, Callable[[Sandbox], Awaitable[None]]] = {
     Runtime.BUN: bun.setup_bun,
 }
 
-def detect_runtime(sandbox: Sandbox) -> RuntimeConfig:
-    """Detect runtime from project files."""
-    work_dir = sandbox.work_dir
-    
-    SKIP_DIRS = {'.git', '.svn', '.hg', '.pytest_cache', '__pycache__', 'node_modules', '.venv'}
-    
-    files = {
-        str(p.relative_to(work_dir))
-        for p in work_dir.rglob("*")
-        if not any(part.startswith('.') or part in SKIP_DIRS for part in p.parts)
+def match_runtime(file_names: Iterable[str]) -> Optional[RuntimeConfig]:
+    """Pick the highest-precedence runtime whose config files appear among the file names."""
+    found = {
+        runtime for name in file_names for runtime in CONFIG_FILE_RUNTIMES.get(name, ())
     }
+    return next(
+        (config for runtime, config in RUNTIME_CONFIGS.items() if runtime in found), None
+    )
 
-    for runtime, config in RUNTIME_CONFIGS.items():
-        if any(any(f.endswith(c) for f in files) for c in config.config_files):
-            return config
+def list_root_files(work_dir: str) -> list[str]:
+    """List files directly under a project directory."""
+    with os.scandir(work_dir) as entries:
+        return [entry.name for entry in entries if entry.is_file()]
 
-    raise ValueError("No supported runtime detected")
+def detect_runtime(sandbox: Sandbox) -> RuntimeConfig:
+    """Detect runtime from project files."""
+    config = match_runtime(list_root_files(str(sandbox.work_dir))) or match_runtime(
+        os.path.basename(path) for path in walk_project_files(sandbox.work_dir)
+    )
+    if not config:
+        raise ValueError("No supported runtime detected")
+    return config
 
 async def install_runtime(sandbox: Sandbox, config: RuntimeConfig) -> None:
     """Install runtime by setting up package manager and installing dependencies"""
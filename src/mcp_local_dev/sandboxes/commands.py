@@ -1,20 +1,24 @@
 """Environment command execution."""
 
+from typing import Dict
+
 from mcp_local_dev.types import PackageManager, Sandbox
 from mcp_local_dev.logging import get_logger
 from mcp_local_dev.sandboxes.sandbox import run_sandboxed_command
 
 logger = get_logger(__name__)
 
+INSTALL_COMMANDS: Dict[PackageManager, list[str]] = {
+    PackageManager.UV: ["uv", "sync", "--all-extras"],
+    PackageManager.NPM: ["npm", "install"],
+    PackageManager.BUN: ["bun", "install"],
+}
+
+
 async def install_packages(sandbox: Sandbox, pkg_manager: PackageManager) -> None:
     """Install project dependencies using the specified package manager."""
-    if pkg_manager == PackageManager.UV:
-        cmd = "uv sync --all-extras"
-    elif pkg_manager == PackageManager.NPM:
-        cmd = "npm install"
-    elif pkg_manager == PackageManager.BUN:
-        cmd = "bun install"
-    else:
+    cmd = INSTALL_COMMANDS.get(pkg_manager)
+    if cmd is None:
         raise RuntimeError(f"Unsupported package manager: {pkg_manager}")
 
     returncode, stdout, stderr = await run_sandboxed_command(sandbox, cmd)
@@ -1,14 +1,25 @@
 """Functions for working with Git and Github"""
 
-from typing import Optional
+import asyncio
+import hashlib
+import os
+import re
+import shutil
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
 from pathlib import Path
 
+import appdirs
 
 from mcp_local_dev.types import Sandbox
 from mcp_local_dev.logging import get_logger
 from mcp_local_dev.sandboxes.sandbox import run_sandboxed_command
 
 
+GITHUB_PREFIX = re.compile(r"^(?:git@github\.com:|(?:https://)?github\.com/)")
+
+
 def normalize_github_url(url: str) -> str:
     """Convert GitHub URL to HTTPS format."""
     if not url:
@@ -17,64 +28,178 @@ def normalize_github_url(url: str) -> str:
     if "?" in url or "#" in url:
         raise ValueError("URLs with query parameters or fragments not supported")
 
-    if url.startswith("git@github.com:"):
-        return f"https://github.com/{url.split(':')[1]}"
-
-    if not url.startswith(("http://", "https://", "github.com")):
-        return f"https://github.com/{url}"
-
     if url.startswith("http://"):
         raise ValueError("HTTP URLs not supported, use HTTPS")
 
-    if url.startswith("github.com"):
-        return f"https://{url}"
+    prefix = GITHUB_PREFIX.match(url)
+    if prefix:
+        return f"https://github.com/{url[prefix.end():]}"
 
-    return url
+    if url.startswith("https://"):
+        return url
 
+    return f"https://github.com/{url}"
 
-logger = get_logger(__name__)
 
+logger = get_logger(__name__)
 
-async def clone_github_repository(
-    sandbox: Sandbox, url: str, branch: Optional[str], subdir: Optional[str] = None
+CLONE_CACHE_DIR = Path(appdirs.user_cache_dir("mcp-local-dev")) / "clones"
+CLONE_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+CLONE_CACHE_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
+
+_clone_locks: Dict[str, tuple[asyncio.Lock, int]] = {}
+
+
+def mirror_path(url: str, cache_dir: Path) -> Path:
+    """Locate the cached bare mirror for a repository URL."""
+    return cache_dir / hashlib.sha256(url.encode()).hexdigest()
+
+
+@asynccontextmanager
+async def clone_lock(mirror: Path) -> AsyncIterator[None]:
+    """Serialize work on one mirror, dropping the lock once no caller holds or awaits it."""
+    key = str(mirror)
+    lock, users = _clone_locks.get(key) or (asyncio.Lock(), 0)
+    _clone_locks[key] = (lock, users + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        lock, users = _clone_locks[key]
+        if users == 1:
+            del _clone_locks[key]
+        else:
+            _clone_locks[key] = (lock, users - 1)
+
+
+def find_stale_mirrors(cache_dir: Path, cutoff: float) -> list[Path]:
+    """List cached mirrors last used before the cutoff time."""
+    if not cache_dir.is_dir():
+        return []
+    with os.scandir(cache_dir) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < cutoff
+        ]
+
+
+def remove_stale_mirror(mirror: Path, cutoff: float) -> None:
+    """Remove a mirror unless it was used again after the cutoff time."""
+    try:
+        if mirror.stat().st_mtime < cutoff:
+            shutil.rmtree(mirror, ignore_errors=True)
+    except FileNotFoundError:
+        pass
+
+
+async def prune_clone_cache(cache_dir: Path, max_age: float = CLONE_CACHE_MAX_AGE) -> None:
+    """Remove cached mirrors that have not been used within max_age seconds, skipping any in use."""
+    cutoff = time.time() - max_age
+    for mirror in await asyncio.to_thread(find_stale_mirrors, cache_dir, cutoff):
+        if str(mirror) in _clone_locks:
+            continue
+        async with clone_lock(mirror):
+            await asyncio.to_thread(remove_stale_mirror, mirror, cutoff)
+
+
+async def update_clone_cache(sandbox: Sandbox, url: str, cache_dir: Path) -> Path:
+    """Create or refresh the local bare mirror of a repository's branches and tags."""
+    mirror = mirror_path(url, cache_dir)
+    creating = not (mirror / "HEAD").exists()
+    if creating:
+        await asyncio.to_thread(shutil.rmtree, mirror, ignore_errors=True)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cmds = [["git", "clone", "--quiet", "--bare", url, str(mirror)]]
+        cmds += [
+            ["git", "--git-dir", str(mirror), "config", "--add", "remote.origin.fetch", refspec]
+            for refspec in CLONE_CACHE_REFSPECS
+        ]
+    else:
+        os.utime(mirror)
+        cmds = [["git", "--git-dir", str(mirror), "fetch", "--quiet", "--prune", "origin"]]
+
+    for cmd in cmds:
+        logger.debug({"event": "updating_clone_cache", "command": cmd})
+
+        returncode, _, stderr = await run_sandboxed_command(sandbox, cmd)
+        if returncode != 0:
+            error = stderr.decode()
+            logger.error(
+                {"event": "clone_cache_failed", "return_code": returncode, "stderr": error}
+            )
+            if creating:
+                await asyncio.to_thread(shutil.rmtree, mirror, ignore_errors=True)
+            raise RuntimeError(f"Failed to clone repository: {error}")
+
+    return mirror
+
+
+async def clone_repository(
+    sandbox: Sandbox, url: str, branch: Optional[str], cache_dir: Optional[Path] = None
 ) -> Path:
-    if not url:
-        raise ValueError("URL cannot be empty")
-
+    """Clone a repository into the sandbox work dir through the persistent mirror cache."""
     target_dir = sandbox.work_dir
+    cache_dir = cache_dir or CLONE_CACHE_DIR
+
+    async with clone_lock(mirror_path(url, cache_dir)):
+        mirror = await update_clone_cache(sandbox, url, cache_dir)
+
+        cmd = [
+            "git",
+            "clone",
+            "--quiet",
+            "--depth=1",
+            "--single-branch",
+            mirror.as_uri(),
+            str(target_dir),
+        ]
+        if branch:
+            cmd += ["-b", branch]
+
+        logger.debug(
+            {
+                "event": "cloning_repository",
+                "command": cmd,
+                "target_dir": str(target_dir),
+                "parent_dir": str(Path(target_dir).parent),
+            }
+        )
 
-    logger.debug(
-        {"event": "clone_github_repository", "url": url, "target_dir": str(target_dir)}
-    )
-
-    url = normalize_github_url(url)
-
-    cmd = f"git clone {url} {target_dir}"
-    if branch:
-        cmd += f" -b {branch}"
-
-    logger.debug(
-        {
-            "event": "cloning_repository",
-            "command": cmd,
-            "target_dir": str(target_dir),
-            "parent_dir": str(Path(target_dir).parent),
-        }
-    )
+        returncode, stdout, stderr = await run_sandboxed_command(sandbox, cmd)
+        if returncode == 0:
+            returncode, stdout, stderr = await run_sandboxed_command(
+                sandbox, ["git", "-C", str(target_dir), "remote", "set-url", "origin", url]
+            )
 
-    returncode, stdout, stderr = await run_sandboxed_command(sandbox, cmd)
     if returncode != 0:
+        error = stderr.decode()
         logger.error(
             {
                 "event": "clone_failed",
                 "return_code": returncode,
-                "stderr": stderr.decode(),
+                "stderr": error,
             }
         )
-        raise RuntimeError(f"Failed to clone repository: {stderr.decode()}")
+        raise RuntimeError(f"Failed to clone repository: {error}")
+
+    await prune_clone_cache(cache_dir)
 
     logger.info(
         {"event": "repository_cloned", "url": url, "target_dir": str(target_dir)}
     )
 
     return target_dir
+
+
+async def clone_github_repository(
+    sandbox: Sandbox, url: str, branch: Optional[str], subdir: Optional[str] = None
+) -> Path:
+    if not url:
+        raise ValueError("URL cannot be empty")
+
+    logger.debug(
+        {"event": "clone_github_repository", "url": url, "target_dir": str(sandbox.work_dir)}
+    )
+
+    return await clone_repository(sandbox, normalize_github_url(url), branch)
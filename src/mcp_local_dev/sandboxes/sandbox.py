@@ -2,6 +2,9 @@
 
 import tempfile
 import asyncio
+import logging
+import os
+import shutil
 import sys
 from pathlib import Path
 
@@ -22,6 +25,20 @@ def get_system_paths() -> str:
             raise RuntimeError(f"Unsupported platform: {sys.platform}")
 
 
+_host_binaries: dict[tuple[str, str | None], str] = {}
+
+
+def find_host_binary(name: str) -> str | None:
+    """Resolve a host executable on PATH, remembering only successful lookups."""
+    key = (name, os.environ.get("PATH"))
+    path = _host_binaries.get(key)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _host_binaries[key] = path
+    return path
+
+
 async def create_sandbox(prefix: str) -> Sandbox:
     """Create new sandbox environment with isolated directories."""
 
@@ -93,32 +110,40 @@ def cleanup_sandbox(sandbox: Sandbox) -> None:
 
 
 async def run_sandboxed_command(
-    sandbox: Sandbox, cmd: str, env_vars: dict[str, str] | None = None
+    sandbox: Sandbox, cmd: str | list[str], env_vars: dict[str, str] | None = None
 ) -> tuple[int, bytes, bytes]:
-    """Run command in sandbox environment and return (returncode, stdout, stderr)."""
+    """Run shell string or argv list in sandbox environment and return (returncode, stdout, stderr)."""
 
-    cmd_env = {**sandbox.env_vars, **(env_vars or {})}
+    cmd_env = {**sandbox.env_vars, **env_vars} if env_vars else sandbox.env_vars
 
     logger.debug({"event": "sandbox_cmd_exec", "cmd": cmd})
 
-    process = await asyncio.create_subprocess_shell(
-        cmd,
-        cwd=sandbox.work_dir,
-        env=cmd_env,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
+    spawn_options = {
+        "cwd": sandbox.work_dir,
+        "env": cmd_env,
+        "stdout": asyncio.subprocess.PIPE,
+        "stderr": asyncio.subprocess.PIPE,
+    }
+    if isinstance(cmd, str):
+        process = await asyncio.create_subprocess_shell(cmd, **spawn_options)
+    else:
+        try:
+            process = await asyncio.create_subprocess_exec(*cmd, **spawn_options)
+        except (FileNotFoundError, PermissionError) as e:
+            logger.debug({"event": "sandbox_cmd_not_found", "cmd": cmd, "error": str(e)})
+            return 127, b"", f"{cmd[0]}: {e.strerror}\n".encode()
 
     stdout, stderr = await process.communicate()
 
-    if stdout:
-        logger.debug(
-            {"event": "sandbox_cmd_stdout", "cmd": cmd, "output": stdout.decode()}
-        )
-    if stderr:
-        logger.debug(
-            {"event": "sandbox_cmd_stderr", "cmd": cmd, "output": stderr.decode()}
-        )
+    if logger.isEnabledFor(logging.DEBUG):
+        if stdout:
+            logger.debug(
+                {"event": "sandbox_cmd_stdout", "cmd": cmd, "output": stdout.decode()}
+            )
+        if stderr:
+            logger.debug(
+                {"event": "sandbox_cmd_stderr", "cmd": cmd, "output": stderr.decode()}
+            )
 
     logger.debug(
         {"event": "sandbox_cmd_complete", "cmd": cmd, "returncode": process.returncode}
@@ -128,8 +153,5 @@ async def run_sandboxed_command(
 
 
 async def is_command_available(sandbox: Sandbox, cmd: str) -> bool:
-    """Checks to see if a command is available in a sandox"""
-
-    code, _, _ = await run_sandboxed_command(sandbox, f"which {cmd}")
-
-    return code == 0
+    """Checks to see if a command is available on the sandbox PATH without spawning a process."""
+    return shutil.which(cmd, path=sandbox.env_vars["PATH"]) is not None
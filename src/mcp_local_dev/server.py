@@ -1,9 +1,9 @@
 """MCP server implementation."""
 
 import asyncio
-import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Awaitable
 
+import anyio
 import mcp.types as types
 from mcp.server.lowlevel import Server
 from mcp.server.models import InitializationOptions
@@ -14,12 +14,17 @@ from mcp_local_dev.environments.environment import (
     create_environment_from_path,
     run_environment_tests,
     cleanup_environment,
+    cleanup_all_environments,
     get_environment,
 )
 from mcp_local_dev.logging import configure_logging, get_logger
+from mcp_local_dev.types import Environment
+from mcp_local_dev.utils.serialization import encode_json
 
 logger = get_logger(__name__)
 
+SHUTDOWN_CLEANUP_TIMEOUT = 30
+
 tools = [
     types.Tool(
         name="local_dev_from_github",
@@ -68,8 +73,80 @@ tools = [
 ]
 
 
+def environment_data(env: Environment) -> Dict[str, Any]:
+    """Describe an environment for tool responses."""
+    return {
+        "id": env.id,
+        "working_dir": str(env.sandbox.work_dir),
+        "created_at": env.created_at.isoformat(),
+        "runtime": env.runtime_config.name.value,
+    }
+
+
+def unknown_environment(env_id: str) -> Dict[str, Any]:
+    """Build the error response for an unknown environment ID."""
+    return {"success": False, "error": f"Unknown environment: {env_id}"}
+
+
+async def handle_from_github(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Create an environment from a GitHub repository."""
+    logger.debug("Creating environment from GitHub")
+    env = await create_environment_from_github(arguments["github_url"])
+    result = {"success": True, "data": environment_data(env)}
+    logger.debug("Environment created successfully: %s", result)
+    return result
+
+
+async def handle_from_filesystem(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Create an environment from a local path."""
+    env = await create_environment_from_path(arguments["path"])
+    return {"success": True, "data": environment_data(env)}
+
+
+async def handle_run_tests(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Run tests in an existing environment."""
+    env = get_environment(arguments["env_id"])
+    if not env:
+        return unknown_environment(arguments["env_id"])
+    result = await run_environment_tests(env)
+    response = {
+        "success": result["success"],
+        "summary": result["summary"],
+    }
+    coverage = result.get("coverage")
+    if coverage:
+        response["coverage"] = {
+            "lines": coverage.lines,
+            "statements": coverage.statements,
+            "branches": coverage.branches,
+            "functions": coverage.functions,
+            "files": coverage.files
+        }
+    return response
+
+
+async def handle_cleanup(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Clean up an existing environment."""
+    env = get_environment(arguments["env_id"])
+    if not env:
+        return unknown_environment(arguments["env_id"])
+    await asyncio.to_thread(cleanup_environment, env)
+    return {
+        "success": True,
+        "data": {"message": "Environment cleaned up successfully"},
+    }
+
+
+TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+    "local_dev_from_github": handle_from_github,
+    "local_dev_from_filesystem": handle_from_filesystem,
+    "local_dev_run_tests": handle_run_tests,
+    "local_dev_cleanup": handle_cleanup,
+}
+
+
 async def init_server() -> Server:
-    logger.info(f"Registered tools: {', '.join(t.name for t in tools)}")
+    logger.info("Registered tools: %s", ", ".join(t.name for t in tools))
 
     server = Server("mcp-local-dev")
 
@@ -83,113 +160,18 @@ async def init_server() -> Server:
         name: str, arguments: Dict[str, Any]
     ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
         try:
-            logger.debug(f"Tool call received: {name} with arguments {arguments}")
-
-            if name == "local_dev_from_github":
-                logger.debug("Creating environment from GitHub")
-                env = await create_environment_from_github(arguments["github_url"])
-                result = {
-                    "success": True,
-                    "data": {
-                        "id": env.id,
-                        "working_dir": str(env.sandbox.work_dir),
-                        "created_at": env.created_at.isoformat(),
-                        "runtime": env.runtime_config.name.value,
-                    },
-                }
-                logger.debug(f"Environment created successfully: {result}")
-                return [types.TextContent(type="text", text=json.dumps(result))]
-
-            elif name == "local_dev_from_filesystem":
-                env = await create_environment_from_path(arguments["path"])
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(
-                            {
-                                "success": True,
-                                "data": {
-                                    "id": env.id,
-                                    "working_dir": str(env.sandbox.work_dir),
-                                    "created_at": env.created_at.isoformat(),
-                                    "runtime": env.runtime_config.name.value,
-                                },
-                            }
-                        ),
-                    )
-                ]
-
-            elif name == "local_dev_run_tests":
-                env = get_environment(arguments["env_id"])
-                if not env:
-                    return [
-                        types.TextContent(
-                            type="text",
-                            text=json.dumps(
-                                {
-                                    "success": False,
-                                    "error": f"Unknown environment: {arguments['env_id']}",
-                                }
-                            ),
-                        )
-                    ]
-                result = await run_environment_tests(env)
-                response = {
-                    "success": result["success"],
-                    "summary": result["summary"],
-                }
-                if result.get("coverage"):
-                    response["coverage"] = {
-                        "lines": result["coverage"].lines,
-                        "statements": result["coverage"].statements,
-                        "branches": result["coverage"].branches,
-                        "functions": result["coverage"].functions,
-                        "files": result["coverage"].files
-                    }
-                return [types.TextContent(type="text", text=json.dumps(response))]
-
-            elif name == "local_dev_cleanup":
-                env = get_environment(arguments["env_id"])
-                if not env:
-                    return [
-                        types.TextContent(
-                            type="text",
-                            text=json.dumps(
-                                {
-                                    "success": False,
-                                    "error": f"Unknown environment: {arguments['env_id']}",
-                                }
-                            ),
-                        )
-                    ]
-                cleanup_environment(env)
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(
-                            {
-                                "success": True,
-                                "data": {
-                                    "message": "Environment cleaned up successfully"
-                                },
-                            }
-                        ),
-                    )
-                ]
-
-            return [
-                types.TextContent(
-                    type="text",
-                    text=json.dumps(
-                        {"success": False, "error": f"Unknown tool: {name}"}
-                    ),
-                )
-            ]
+            logger.debug("Tool call received: %s with arguments %s", name, arguments)
+            handler = TOOL_HANDLERS.get(name)
+            if not handler:
+                result = {"success": False, "error": f"Unknown tool: {name}"}
+            else:
+                result = await handler(arguments)
+            return [types.TextContent(type="text", text=encode_json(result))]
 
         except Exception as e:
             return [
                 types.TextContent(
-                    type="text", text=json.dumps({"success": False, "error": str(e)})
+                    type="text", text=encode_json({"success": False, "error": str(e)})
                 )
             ]
 
@@ -198,7 +180,7 @@ async def init_server() -> Server:
         progress_token: str | int, progress: float, total: float | None = None
     ) -> None:
         """Handle progress notifications."""
-        logger.debug(f"Progress notification: {progress}/{total if total else '?'}")
+        logger.debug("Progress notification: %s/%s", progress, total if total else "?")
 
     return server
 
@@ -215,7 +197,11 @@ async def serve() -> None:
                 logging=types.LoggingCapability(),
             ),
         )
-        await server.run(read_stream, write_stream, init_options)
+        try:
+            await server.run(read_stream, write_stream, init_options)
+        finally:
+            with anyio.move_on_after(SHUTDOWN_CLEANUP_TIMEOUT, shield=True):
+                await cleanup_all_environments()
 
 
 def main() -> None:
@@ -1,5 +1,6 @@
 """Runner implementation for Jest"""
 
+from pathlib import Path
 from typing import Dict, Any
 import json
 from mcp_local_dev.types import Environment, RunnerType, Runtime, CoverageResult
@@ -8,6 +9,23 @@ from mcp_local_dev.sandboxes.sandbox import run_sandboxed_command, is_command_av
 
 logger = get_logger(__name__)
 
+JEST_CONFIG_FILES = (
+    "jest.config.js",
+    "jest.config.ts",
+    "jest.config.mjs",
+    "jest.config.cjs",
+    "jest.config.json",
+)
+
+def has_package_json_jest_config(work_dir: Path) -> bool:
+    """Check whether package.json carries a "jest" configuration key."""
+    try:
+        with open(work_dir / "package.json", "rb") as f:
+            package = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return isinstance(package, dict) and "jest" in package
+
 def parse_jest_coverage(coverage_map: dict) -> CoverageResult:
     """Parse Jest coverage data into standardized format"""
     files = {}
@@ -26,17 +44,17 @@ def parse_jest_coverage(coverage_map: dict) -> CoverageResult:
         f = file_coverage.get("f", {})  # Function map
         
         # Calculate statement coverage
-        covered_statements = sum(1 for hit in s.values() if hit > 0)
+        covered_statements = sum(map(bool, s.values()))
         total_statements += len(s)
         total_covered_statements += covered_statements
         
         # Calculate branch coverage
-        covered_branches = sum(1 for hits in b.values() if any(h > 0 for h in hits))
+        covered_branches = sum(map(any, b.values()))
         total_branches += len(b)
         total_covered_branches += covered_branches
         
         # Calculate function coverage
-        covered_functions = sum(1 for hit in f.values() if hit > 0)
+        covered_functions = sum(map(bool, f.values()))
         total_functions += len(f)
         total_covered_functions += covered_functions
         
@@ -58,14 +76,24 @@ def parse_jest_coverage(coverage_map: dict) -> CoverageResult:
 
 async def run_jest(env: Environment) -> Dict[str, Any]:
     """Run Jest and parse results"""
-    cmd_prefix = "bun" if env.runtime_config.name == Runtime.BUN else "node --experimental-vm-modules"
+    cmd_prefix = (
+        ["bun"]
+        if env.runtime_config.name == Runtime.BUN
+        else ["node", "--experimental-vm-modules"]
+    )
     # Install coverage dependencies
     await run_sandboxed_command(
         env.sandbox,
-        "npm install -D jest-coverage-badges --legacy-peer-deps"
+        ["npm", "install", "-D", "jest-coverage-badges", "--legacy-peer-deps"]
     )
     
-    cmd = f"{cmd_prefix} node_modules/jest/bin/jest.js --coverage --json --coverageReporters=json-summary"
+    cmd = [
+        *cmd_prefix,
+        "node_modules/jest/bin/jest.js",
+        "--coverage",
+        "--json",
+        "--coverageReporters=json-summary",
+    ]
     returncode, stdout, stderr = await run_sandboxed_command(env.sandbox, cmd)
 
     if returncode not in (0, 1):
@@ -112,8 +140,8 @@ async def check_jest(env: Environment) -> bool:
     if env.runtime_config.name != Runtime.NODE:
         return False
         
+    work_dir = env.sandbox.work_dir
     config_exists = any(
-        env.sandbox.work_dir.glob(p) 
-        for p in ["jest.config.js", "jest.config.mjs", "jest.config.json"]
-    )
+        (work_dir / name).is_file() for name in JEST_CONFIG_FILES
+    ) or has_package_json_jest_config(work_dir)
     return config_exists and await is_command_available(env.sandbox, "jest")
@@ -1,5 +1,6 @@
 """Runner implementation for pytest"""
 
+import io
 import json
 from typing import Dict, Any
 from mcp_local_dev.types import Environment, RunnerType, Runtime, CoverageResult
@@ -8,6 +9,42 @@ from mcp_local_dev.sandboxes.sandbox import run_sandboxed_command, is_command_av
 
 logger = get_logger(__name__)
 
+PYTEST_STATUSES = {
+    "PASSED": "passed",
+    "XPASS": "passed",
+    "FAILED": "failed",
+    "ERROR": "failed",
+    "SKIPPED": "skipped",
+    "XFAIL": "skipped",
+}
+
+
+def parse_pytest_output(output: str) -> tuple[list[dict], dict[str, int]]:
+    """Parse verbose pytest output into per-test outcomes and a status summary."""
+    tests = []
+    summary = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
+
+    for line in io.StringIO(output):
+        sep = line.find("::")
+        if sep == -1 or line.partition(" ")[0] in PYTEST_STATUSES:
+            continue
+        end = line.find(" ", sep)
+        if end == -1:
+            continue
+        params = line.find("[", sep, end)
+        if params != -1:
+            end = line.find("] ", params) + 1
+        words = line[end:].split(None, 1) if end else None
+        status = PYTEST_STATUSES.get(words[0]) if words else None
+        if status is None:
+            continue
+
+        tests.append({"nodeid": line[sep + 2 : end], "outcome": status})
+        summary[status] += 1
+        summary["total"] += 1
+
+    return tests, summary
+
 
 def parse_coverage_data(data: dict) -> CoverageResult:
     """Parse coverage.py JSON output into standardized format"""
@@ -39,19 +76,14 @@ async def run_pytest(env: Environment) -> Dict[str, Any]:
         {"event": "starting_pytest_run", "work_dir": str(env.sandbox.work_dir)}
     )
 
-    # Install coverage dependencies
-    await run_sandboxed_command(
-        env.sandbox, "uv pip install coverage==7.6.10 pytest-cov==6.0.0"
-    )
-
     env_vars = {
         "PYTHONPATH": str(env.sandbox.work_dir),
         "COVERAGE_FILE": str(env.sandbox.tmp_dir / ".coverage"),
-        **env.sandbox.env_vars,
     }
     logger.debug({"event": "pytest_env_vars", "env": env_vars})
 
     cmd = (
+        "uv pip install coverage==7.6.10 pytest-cov==6.0.0; "
         "pytest -v --capture=no --tb=short -p no:warnings "
         "--cov --cov-report=json --cov-branch"
     )
@@ -73,28 +105,7 @@ async def run_pytest(env: Environment) -> Dict[str, Any]:
     stdout_text = stdout.decode() if stdout else ""
     stderr_text = stderr.decode() if stderr else ""
 
-    tests = []
-    summary = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
-
-    for line in stdout_text.splitlines():
-        if "::" in line and any(
-            status in line for status in ["PASSED", "FAILED", "SKIPPED"]
-        ):
-            test_name = line.split("::")[1].split()[0]
-            status = (
-                "passed"
-                if "PASSED" in line
-                else "failed" if "FAILED" in line else "skipped"
-            )
-            test = {
-                "nodeid": test_name,
-                "outcome": status,
-                # "stdout": stdout_text,
-                # "duration": 0.0,
-            }
-            tests.append(test)
-            summary[status] += 1
-            summary["total"] += 1
+    tests, summary = parse_pytest_output(stdout_text)
 
     # Parse coverage data if available
     coverage = None
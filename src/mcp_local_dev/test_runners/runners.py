@@ -59,6 +59,7 @@ async def execute_runner(config: RunConfig) -> Dict[str, Any]:
     _, run_tests = runner_funcs
     result = await run_tests(config.env)
 
+    coverage = result.get("coverage")
     logger.info(
         {
             "event": "test_run_complete",
@@ -66,11 +67,11 @@ async def execute_runner(config: RunConfig) -> Dict[str, Any]:
             "success": result["success"],
             "summary": result.get("summary", {}),
             "coverage": {
-                "lines": result["coverage"].lines if result.get("coverage") else 0,
-                "statements": result["coverage"].statements if result.get("coverage") else 0,
-                "branches": result["coverage"].branches if result.get("coverage") else 0,
-                "functions": result["coverage"].functions if result.get("coverage") else 0,
-            } if result.get("coverage") else None
+                "lines": coverage.lines,
+                "statements": coverage.statements,
+                "branches": coverage.branches,
+                "functions": coverage.functions,
+            } if coverage else None
         }
     )
 
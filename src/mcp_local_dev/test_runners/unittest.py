@@ -1,13 +1,43 @@
 """Runner implementation for unittest"""
 
+import io
 import json
 from typing import Dict, Any
 from mcp_local_dev.types import Environment, RunnerType, Runtime, CoverageResult
 from mcp_local_dev.logging import get_logger
 from mcp_local_dev.sandboxes.sandbox import run_sandboxed_command
+from mcp_local_dev.utils.files import find_project_files
 
 logger = get_logger(__name__)
 
+UNITTEST_STATUSES = {
+    "ok": "passed",
+    "expected": "passed",
+    "FAIL": "failed",
+    "ERROR": "failed",
+    "unexpected": "failed",
+    "skipped": "skipped",
+}
+
+
+def parse_unittest_output(output: str) -> tuple[list[dict], dict[str, int]]:
+    """Parse verbose unittest output into per-test outcomes and a status summary."""
+    tests = []
+    summary = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
+
+    for line in io.StringIO(output):
+        test_path, sep, result = line.partition(" ... ")
+        words = result.split(None, 1)
+        status = UNITTEST_STATUSES.get(words[0]) if sep and words else None
+        if status is None:
+            continue
+
+        tests.append({"nodeid": test_path.partition("(")[0].strip(), "outcome": status})
+        summary[status] += 1
+        summary["total"] += 1
+
+    return tests, summary
+
 
 async def run_unittest(env: Environment) -> Dict[str, Any]:
     """Run unittest and parse results"""
@@ -15,13 +45,11 @@ async def run_unittest(env: Environment) -> Dict[str, Any]:
         {"event": "starting_unittest_run", "work_dir": str(env.sandbox.work_dir)}
     )
 
-    env_vars = {"PYTHONPATH": str(env.sandbox.work_dir), **env.sandbox.env_vars}
+    env_vars = {"PYTHONPATH": str(env.sandbox.work_dir)}
     logger.debug({"event": "unittest_env_vars", "env": env_vars})
 
-    # Install coverage
-    await run_sandboxed_command(env.sandbox, "uv pip install coverage==7.6.10")
-
     cmd = (
+        "uv pip install coverage==7.6.10; "
         "coverage run --branch -m unittest discover -v && "
         "coverage json -o coverage.json"
     )
@@ -32,30 +60,7 @@ async def run_unittest(env: Environment) -> Dict[str, Any]:
         stderr.decode() if stderr else ""
     )  # unittest writes to stderr in verbose mode
 
-    tests = []
-    summary = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
-
-    for line in output_text.splitlines():
-        if " ... " in line:
-            # Parse test name from format: "test_name (test.module.TestClass.test_name)"
-            test_path = line.split(" ... ")[0].strip()
-            if "(" in test_path:
-                test_name = test_path.split("(")[0]
-            else:
-                test_name = test_path
-
-            # Parse status
-            status = "passed" if "ok" in line.lower() else "failed"
-            if "skipped" in line.lower():
-                status = "skipped"
-
-            test = {
-                "nodeid": test_name,
-                "outcome": status,
-            }
-            tests.append(test)
-            summary[status] += 1
-            summary["total"] += 1
+    tests, summary = parse_unittest_output(output_text)
 
     # Parse coverage data if available
     coverage = None
@@ -99,9 +104,7 @@ async def check_unittest(env: Environment) -> bool:
     if env.runtime_config.name != Runtime.PYTHON:
         return False
 
-    test_files = list(env.sandbox.work_dir.rglob("test_*.py"))
-
-    for test_file in test_files:
+    for test_file in find_project_files(env.sandbox.work_dir, "test_*.py"):
         with open(test_file, "r") as f:
             content = f.read()
             if any(
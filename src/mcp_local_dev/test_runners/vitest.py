@@ -1,6 +1,7 @@
 """Runner implementation for Vitest"""
 
 from typing import Dict, Any
+import io
 import json
 import traceback
 from mcp_local_dev.types import Environment, RunnerType, Runtime, CoverageResult
@@ -9,21 +10,29 @@ from mcp_local_dev.sandboxes.sandbox import run_sandboxed_command, is_command_av
 
 logger = get_logger(__name__)
 
+VITEST_CONFIG_FILES = (
+    "vitest.config.js",
+    "vitest.config.ts",
+    "vite.config.js",
+    "vite.config.ts",
+)
+
 
 def parse_vitest_coverage_text(coverage_text: str) -> CoverageResult:
     """Parse Vitest coverage report text format into standardized format"""
     # Extract values from format like:
     # All files |   93.75 |    93.75 |     100 |   93.75 |
-    lines = coverage_text.split("\n")
-    summary_line = next(line for line in lines if line.startswith("All files"))
-    parts = [p.strip() for p in summary_line.split("|")]
-
-    # Get file-specific coverage
+    parts = None
     files = {}
-    for line in lines:
-        if line.startswith(" core.js"):
+    for line in io.StringIO(coverage_text):
+        if parts is None and line.startswith("All files"):
             parts = [p.strip() for p in line.split("|")]
-            files[parts[0].strip()] = float(parts[1])
+        elif line.startswith(" core.js"):
+            file_parts = [p.strip() for p in line.split("|")]
+            files[file_parts[0]] = float(file_parts[1])
+
+    if parts is None:
+        raise ValueError("No coverage summary found in Vitest output")
 
     return CoverageResult(
         lines=float(parts[4]),  # % Lines
@@ -48,10 +57,11 @@ async def run_vitest(env: Environment) -> Dict[str, Any]:
 
     # Install coverage dependency if needed
     await run_sandboxed_command(
-        env.sandbox, "npm install -D @vitest/coverage-v8 --legacy-peer-deps"
+        env.sandbox,
+        ["npm", "install", "-D", "@vitest/coverage-v8", "--legacy-peer-deps"],
     )
 
-    cmd = "vitest run --coverage --reporter json"
+    cmd = ["vitest", "run", "--coverage", "--reporter", "json"]
     logger.debug({"event": "running_vitest_cmd", "cmd": cmd})
     returncode, stdout, stderr = await run_sandboxed_command(env.sandbox, cmd)
 
@@ -138,6 +148,6 @@ async def check_vitest(env: Environment) -> bool:
         return False
 
     config_exists = any(
-        env.sandbox.work_dir.glob(p) for p in ["vitest.config.js", "vitest.config.ts"]
+        (env.sandbox.work_dir / name).is_file() for name in VITEST_CONFIG_FILES
     )
     return config_exists and await is_command_available(env.sandbox, "vitest")
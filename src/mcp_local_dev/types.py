@@ -16,7 +16,7 @@ class RunnerType(Enum):
     JEST = 'jest'
     VITEST = 'vitest'
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
     """Runtime configuration"""
     name: Runtime
@@ -25,7 +25,7 @@ class RuntimeConfig:
     env_setup: dict[str, str]
     binary_name: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Sandbox:
     """Isolated execution environment"""
     root: Path
@@ -36,7 +36,7 @@ class Sandbox:
     temp_dir: TemporaryDirectory
     env_vars: dict[str, str]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Environment:
     """Runtime environment"""
     id: str
@@ -44,14 +44,14 @@ class Environment:
     created_at: datetime
     sandbox: Sandbox
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunConfig:
     """Test run configuration"""
     runner: RunnerType
     env: Environment
     test_dirs: List[Path]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CoverageResult:
     """Test coverage results"""
     lines: float  # Percentage of lines covered
@@ -60,7 +60,7 @@ class CoverageResult:
     functions: float  # Percentage of functions covered
     files: dict[str, float]  # Per-file line coverage percentages
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TestCase:
     """Test execution result"""
     name: str
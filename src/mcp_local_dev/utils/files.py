@@ -0,0 +1,60 @@
+"""Filesystem traversal helpers."""
+
+import fnmatch
+import os
+import shutil
+from collections import deque
+from pathlib import Path
+from typing import Iterator
+
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".svn",
+        ".hg",
+        ".tox",
+        ".venv",
+        "venv",
+        ".mypy_cache",
+        ".pytest_cache",
+        "__pycache__",
+        "node_modules",
+        "target",
+        "dist",
+        "build",
+    }
+)
+
+
+def walk_project_files(root: Path) -> Iterator[str]:
+    """Yield project file paths relative to root, pruning hidden, vendored and build directories."""
+    queue = deque([str(root)])
+    while queue:
+        with os.scandir(queue.popleft()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if not entry.is_dir(follow_symlinks=False):
+                    yield os.path.relpath(entry.path, root)
+                elif entry.name not in SKIP_DIRS:
+                    queue.append(entry.path)
+
+
+def find_project_files(root: Path, pattern: str) -> Iterator[Path]:
+    """Lazily yield project files whose names match a glob pattern."""
+    for path in walk_project_files(root):
+        if fnmatch.fnmatch(os.path.basename(path), pattern):
+            yield root / path
+
+
+def link_or_copy(src: str, dst: str, *, root: str) -> str:
+    """Hard-link a file that resolves inside root, copying symlinked or outside files and across filesystems."""
+    real = os.path.realpath(src)
+    if not os.path.islink(src) and os.path.commonpath([real, root]) == root:
+        try:
+            os.link(real, dst)
+            return dst
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+    return dst
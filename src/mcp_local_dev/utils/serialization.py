@@ -0,0 +1,32 @@
+"""JSON serialization helpers."""
+
+import json
+from enum import Enum
+from typing import Any
+
+
+def coerce_json(obj: Any) -> Any:
+    """Fallback for values the JSON encoder cannot serialize natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+encode_json_stdlib = json.JSONEncoder(separators=(",", ":"), default=coerce_json).encode
+
+try:
+    import orjson
+
+    def encode_json(obj: Any) -> str:
+        """Serialize an object to compact JSON using orjson, deferring to the stdlib encoder for anything orjson rejects."""
+        try:
+            return orjson.dumps(
+                obj,
+                default=coerce_json,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+        except orjson.JSONEncodeError:
+            return encode_json_stdlib(obj)
+
+except ImportError:
+    encode_json = encode_json_stdlib
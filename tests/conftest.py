@@ -3,8 +3,16 @@ import pytest
 import pytest_asyncio
 from pathlib import Path
 
+from mcp_local_dev.sandboxes import git
 from mcp_local_dev.sandboxes.sandbox import create_sandbox, cleanup_sandbox
 
+@pytest.fixture(autouse=True)
+def clone_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep repository mirrors cloned during tests out of the user cache."""
+    cache_dir = tmp_path / "clone-cache"
+    monkeypatch.setattr(git, "CLONE_CACHE_DIR", cache_dir)
+    return cache_dir
+
 @pytest_asyncio.fixture
 async def sandbox():
     """Create a temporary sandbox for testing."""
@@ -6,6 +6,8 @@ from pathlib import Path
 from mcp_local_dev.environments.environment import (
     create_environment_from_path,
     cleanup_environment,
+    cleanup_all_environments,
+    get_environment,
 )
 from mcp_local_dev.types import Runtime
 from mcp_local_dev.sandboxes.sandbox import run_sandboxed_command
@@ -67,6 +69,24 @@ async def test_cleanup_environment(tmp_path: Path):
     assert not work_dir.exists()
 
 
+@pytest.mark.asyncio
+async def test_cleanup_all_environments(tmp_path: Path):
+    """Test every registered environment is cleaned up"""
+    fixture_dir = (
+        Path(__file__).parent.parent / "fixtures_data" / "python" / "pytest-project"
+    )
+    project_dir = tmp_path / "pytest-project"
+    shutil.copytree(fixture_dir, project_dir)
+
+    envs = [await create_environment_from_path(project_dir) for _ in range(2)]
+
+    await cleanup_all_environments()
+
+    for env in envs:
+        assert get_environment(env.id) is None
+        assert not env.sandbox.root.exists()
+
+
 @pytest.mark.asyncio
 async def test_create_environment_from_github():
     """Test creating environment from GitHub repo"""
@@ -0,0 +1,61 @@
+import os
+import shutil
+from functools import partial
+from pathlib import Path
+
+from mcp_local_dev.utils.files import find_project_files, link_or_copy
+
+
+def test_link_or_copy_tree(tmp_path: Path):
+    """Test copied trees share file data with the disposable source"""
+    source = tmp_path / "source"
+    (source / "pkg").mkdir(parents=True)
+    (source / "pkg" / "module.py").write_text("VALUE = 1\n")
+    target = tmp_path / "target"
+
+    shutil.copytree(
+        source, target, copy_function=partial(link_or_copy, root=os.path.realpath(source))
+    )
+
+    copied = target / "pkg" / "module.py"
+    assert copied.read_text() == "VALUE = 1\n"
+    assert os.path.samefile(copied, source / "pkg" / "module.py")
+
+    shutil.rmtree(source)
+    assert copied.read_text() == "VALUE = 1\n"
+
+
+def test_link_or_copy_copies_files_outside_tree(tmp_path: Path):
+    """Test symlinks leading out of the source are copied rather than hard-linked"""
+    host = tmp_path / "host"
+    (host / "shared").mkdir(parents=True)
+    (host / "secret.txt").write_text("host\n")
+    (host / "shared" / "data.txt").write_text("host\n")
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "secret.txt").symlink_to(host / "secret.txt")
+    (source / "shared").symlink_to(host / "shared")
+    target = tmp_path / "target"
+
+    shutil.copytree(
+        source, target, copy_function=partial(link_or_copy, root=os.path.realpath(source))
+    )
+
+    for name in ("secret.txt", "shared/data.txt"):
+        copied = target / name
+        assert not os.path.samefile(copied, host / name)
+        copied.write_text("sandbox\n")
+        assert (host / name).read_text() == "host\n"
+
+
+def test_find_project_files_shares_pruning(tmp_path: Path):
+    """Test pattern matches skip hidden files and vendored directories"""
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_core.py").write_text("")
+    (tmp_path / ".test_hidden.py").write_text("")
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "test_dep.py").write_text("")
+
+    assert list(find_project_files(tmp_path, "*.py")) == [
+        tmp_path / "tests" / "test_core.py"
+    ]
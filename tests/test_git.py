@@ -1,10 +1,27 @@
+import asyncio
+import os
+import subprocess
+
 import pytest
 import pytest_asyncio
 from pathlib import Path
 
-from mcp_local_dev.sandboxes.git import normalize_github_url, clone_github_repository
+from mcp_local_dev.sandboxes.git import (
+    clone_github_repository,
+    clone_repository,
+    normalize_github_url,
+    _clone_locks,
+    clone_lock,
+    mirror_path,
+    prune_clone_cache,
+    update_clone_cache,
+)
 from mcp_local_dev.types import Sandbox
-from mcp_local_dev.sandboxes.sandbox import run_sandboxed_command, cleanup_sandbox
+from mcp_local_dev.sandboxes.sandbox import (
+    cleanup_sandbox,
+    create_sandbox,
+    run_sandboxed_command,
+)
 
 @pytest.mark.parametrize("input_url,expected", [
     ("git@github.com:user/repo.git", "https://github.com/user/repo.git"),
@@ -65,3 +82,143 @@ async def test_clone_github_repository_empty_url(sandbox: Sandbox):
     """Test cloning with empty URL fails appropriately"""
     with pytest.raises(ValueError):
         await clone_github_repository(sandbox, "", None)
+
+
+def commit_file(repo: Path, name: str, content: str) -> None:
+    """Write a file into a local repository and commit it."""
+    (repo / name).write_text(content)
+    subprocess.run(["git", "-C", str(repo), "add", name], check=True)
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=test", "-c", "user.email=test@example.com",
+         "commit", "-q", "-m", f"Add {name}"],
+        check=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_clone_repository_uses_mirror_cache(sandbox: Sandbox, tmp_path: Path):
+    """Test clones go through a refreshed local mirror and keep the upstream origin"""
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    subprocess.run(["git", "init", "-q", "-b", "main", str(upstream)], check=True)
+    commit_file(upstream, "pyproject.toml", "[project]\nname = 'x'\n")
+    url = upstream.as_uri()
+    cache_dir = tmp_path / "cache"
+
+    target_dir = await clone_repository(sandbox, url, "main", cache_dir)
+
+    mirrors = list(cache_dir.iterdir())
+    assert len(mirrors) == 1 and (mirrors[0] / "HEAD").exists()
+    assert (target_dir / "pyproject.toml").exists()
+    _, stdout, _ = await run_sandboxed_command(
+        sandbox, ["git", "-C", str(target_dir), "remote", "get-url", "origin"]
+    )
+    assert stdout.decode().strip() == url
+    _, stdout, _ = await run_sandboxed_command(
+        sandbox, ["git", "-C", str(target_dir), "rev-parse", "--is-shallow-repository"]
+    )
+    assert stdout.decode().strip() == "true"
+
+    commit_file(upstream, "README.md", "updated\n")
+    second = await create_sandbox("test-")
+    try:
+        target_dir = await clone_repository(second, url, "main", cache_dir)
+        assert (target_dir / "README.md").exists()
+        assert list(cache_dir.iterdir()) == mirrors
+    finally:
+        cleanup_sandbox(second)
+
+
+@pytest.mark.asyncio
+async def test_clone_cache_tracks_only_branches_and_tags(sandbox: Sandbox, tmp_path: Path):
+    """Test the mirror cache skips pull request refs and follows new branches"""
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    subprocess.run(["git", "init", "-q", "-b", "main", str(upstream)], check=True)
+    commit_file(upstream, "pyproject.toml", "[project]\nname = 'x'\n")
+    subprocess.run(["git", "-C", str(upstream), "tag", "v1"], check=True)
+    subprocess.run(
+        ["git", "-C", str(upstream), "update-ref", "refs/pull/1/head", "HEAD"], check=True
+    )
+    url = upstream.as_uri()
+    cache_dir = tmp_path / "cache"
+
+    mirror = await update_clone_cache(sandbox, url, cache_dir)
+    subprocess.run(["git", "-C", str(upstream), "branch", "feature"], check=True)
+    await update_clone_cache(sandbox, url, cache_dir)
+
+    refs = subprocess.run(
+        ["git", "--git-dir", str(mirror), "for-each-ref", "--format=%(refname)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    assert sorted(refs) == ["refs/heads/feature", "refs/heads/main", "refs/tags/v1"]
+
+
+@pytest.mark.asyncio
+async def test_clone_repository_reads_cache_location_per_call(
+    sandbox: Sandbox, tmp_path: Path, clone_cache: Path
+):
+    """Test clones without an explicit cache_dir use the current cache location"""
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    subprocess.run(["git", "init", "-q", "-b", "main", str(upstream)], check=True)
+    commit_file(upstream, "pyproject.toml", "[project]\nname = 'x'\n")
+    url = upstream.as_uri()
+
+    await clone_repository(sandbox, url, "main")
+
+    assert (mirror_path(url, clone_cache) / "HEAD").exists()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_clones_share_and_release_lock(tmp_path: Path):
+    """Test concurrent clones of one URL both succeed and leave no lock behind"""
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    subprocess.run(["git", "init", "-q", "-b", "main", str(upstream)], check=True)
+    commit_file(upstream, "pyproject.toml", "[project]\nname = 'x'\n")
+    url = upstream.as_uri()
+    cache_dir = tmp_path / "cache"
+
+    sandboxes = [await create_sandbox("test-") for _ in range(3)]
+    try:
+        targets = await asyncio.gather(
+            *(clone_repository(sb, url, "main", cache_dir) for sb in sandboxes)
+        )
+        assert all((target / "pyproject.toml").exists() for target in targets)
+        assert not _clone_locks
+    finally:
+        for sb in sandboxes:
+            cleanup_sandbox(sb)
+
+
+@pytest.mark.asyncio
+async def test_prune_clone_cache(tmp_path: Path):
+    """Test only mirrors unused for longer than the max age are removed"""
+    stale = tmp_path / "stale"
+    fresh = tmp_path / "fresh"
+    stale.mkdir()
+    fresh.mkdir()
+    os.utime(stale, (0, 0))
+
+    await prune_clone_cache(tmp_path, max_age=60)
+
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+@pytest.mark.asyncio
+async def test_prune_clone_cache_skips_locked_mirrors(tmp_path: Path):
+    """Test a stale mirror is kept while another clone holds its lock"""
+    stale = tmp_path / "stale"
+    stale.mkdir()
+    os.utime(stale, (0, 0))
+
+    async with clone_lock(stale):
+        await prune_clone_cache(tmp_path, max_age=60)
+        assert stale.exists()
+
+    await prune_clone_cache(tmp_path, max_age=60)
+    assert not stale.exists()
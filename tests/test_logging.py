@@ -1,14 +1,34 @@
 import logging
+import logging.handlers
 import json
+import time
 import pytest
+from pathlib import Path
 from mcp_local_dev.logging import (
     JsonFormatter,
     configure_logging,
+    format_timestamp,
     log_with_data,
     get_logger,
 )
 
 
+@pytest.fixture
+def capture_records():
+    """Buffer the records emitted through a logger for the duration of a test."""
+    attached = []
+
+    def capture(logger: logging.Logger) -> list[logging.LogRecord]:
+        handler = logging.handlers.BufferingHandler(capacity=1000)
+        logger.addHandler(handler)
+        attached.append((logger, handler))
+        return handler.buffer
+
+    yield capture
+    for logger, handler in attached:
+        logger.removeHandler(handler)
+
+
 def test_format_json_log():
     """Test JSON log formatting"""
     formatter = JsonFormatter()
@@ -44,7 +64,20 @@ def test_format_json_log_colors(level, expected_color):
     assert output.endswith("\033[0m")
 
 
-def test_log_with_data():
+def test_format_json_log_without_colors():
+    """Test no ANSI codes are emitted when colors are disabled"""
+    formatter = JsonFormatter(colors=False)
+    record = logging.LogRecord(
+        "test", logging.ERROR, "test.py", 10, "Test message", (), None
+    )
+
+    output = formatter.format(record)
+
+    assert "\033" not in output
+    assert json.loads(output)["msg"] == "Test message"
+
+
+def test_log_with_data(capture_records):
     """Test structured logging with data"""
     logger = logging.getLogger("test")
     logger.setLevel(logging.INFO)
@@ -52,21 +85,11 @@ def test_log_with_data():
     test_data = {"key": "value"}
     log_with_data(logger, logging.INFO, "Test message", test_data)
 
-    # Verify through handler
-    class TestHandler(logging.Handler):
-        def __init__(self):
-            super().__init__()
-            self.records = []
-
-        def emit(self, record):
-            self.records.append(record)
-
-    handler = TestHandler()
-    logger.addHandler(handler)
+    records = capture_records(logger)
 
     log_with_data(logger, logging.INFO, "Test message", test_data)
-    assert len(handler.records) == 1
-    assert handler.records[0].data == test_data
+    assert len(records) == 1
+    assert records[0].data == test_data
 
 
 def test_log_with_data_json_structure():
@@ -113,5 +136,77 @@ def test_configure_logging():
 
     assert logger.level == logging.DEBUG
     assert len(logger.handlers) == 1
-    assert isinstance(logger.handlers[0], logging.StreamHandler)
+    assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
     assert not logger.propagate
+    assert not logging.logThreads and not logging.logProcesses
+
+
+def test_log_with_data_caller_info(capture_records):
+    """Test structured records carry the caller's location"""
+    logger = logging.getLogger("test_caller")
+    logger.setLevel(logging.INFO)
+
+    records = capture_records(logger)
+
+    log_with_data(logger, logging.INFO, "With data", {"key": "value"})
+    log_with_data(logger, logging.INFO, "Without data")
+
+    assert [r.funcName for r in records] == ["test_log_with_data_caller_info"] * 2
+    assert all(r.module == "test_logging" and r.lineno > 0 for r in records)
+
+
+def test_log_with_data_respects_level(capture_records):
+    """Test structured records below the logger level are dropped"""
+    logger = logging.getLogger("test_level")
+    logger.setLevel(logging.WARNING)
+
+    records = capture_records(logger)
+
+    log_with_data(logger, logging.DEBUG, "Dropped", {"key": "value"})
+    log_with_data(logger, logging.ERROR, "Kept", {"key": "value"})
+
+    assert [r.getMessage() for r in records] == ["Kept"]
+
+
+def test_format_timestamp():
+    """Test timestamps match the stdlib layout across cached seconds"""
+    created = 1700000000.5
+    expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created)) + ",500"
+
+    assert format_timestamp(created) == expected
+    assert format_timestamp(created + 0.0001) == expected
+    assert format_timestamp(created + 0.25).endswith(",750")
+    assert format_timestamp(created + 1) == (
+        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created + 1)) + ",500"
+    )
+
+
+def test_format_json_log_coerces_unserializable_data():
+    """Test structured data with non-JSON values still renders"""
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        "test", logging.INFO, "test.py", 10, "Test message", (), None
+    )
+    record.data = {"path": Path("/tmp/project"), "ids": {1, 2}}
+
+    output = formatter.format(record)
+    data = json.loads(output.strip("\033[32m\033[0m"))
+
+    assert data["data"]["path"] == "/tmp/project"
+    assert data["data"]["ids"] == "{1, 2}"
+
+
+def test_format_json_log_escapes_fields():
+    """Test message and location fields are JSON-escaped"""
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        "test", logging.INFO, "test.py", 10, 'Quote " and\nnewline ünï', (), None
+    )
+
+    output = formatter.format(record)
+    data = json.loads(output.strip("\033[32m\033[0m"))
+
+    assert data["msg"] == 'Quote " and\nnewline ünï'
+    assert data["func"] is None
+    assert data["line"] == 10
+    assert "data" not in data
@@ -1,5 +1,10 @@
 """Test runner detection and execution."""
 
+import shutil
+import subprocess
+import sys
+from datetime import datetime, timezone
+
 import pytest
 from pathlib import Path
 
@@ -12,7 +17,12 @@ from mcp_local_dev.test_runners.runners import (
     execute_runner,
     detect_and_run_tests,
 )
-from mcp_local_dev.types import RunConfig, RunnerType
+from mcp_local_dev.runtimes import node, python
+from mcp_local_dev.test_runners.jest import check_jest, parse_jest_coverage
+from mcp_local_dev.test_runners.pytest import parse_pytest_output
+from mcp_local_dev.test_runners.unittest import check_unittest, parse_unittest_output
+from mcp_local_dev.test_runners.vitest import check_vitest, parse_vitest_coverage_text
+from mcp_local_dev.types import Environment, RunConfig, RunnerType, Sandbox
 
 
 @pytest.mark.asyncio
@@ -274,3 +284,206 @@ async def test_runner_detection_precedence(fixture_path: Path):
         assert runners[0] == RunnerType.VITEST
     finally:
         cleanup_environment(env)
+
+
+def test_parse_unittest_output(fixture_path: Path):
+    """Test parsing real verbose unittest output from the fixture project."""
+    project_dir = fixture_path / "python" / "unittest-project"
+    proc = subprocess.run(
+        [sys.executable, "-m", "unittest", "discover", "-v"],
+        cwd=project_dir,
+        env={"PYTHONPATH": str(project_dir / "src")},
+        capture_output=True,
+        text=True,
+    )
+
+    tests, summary = parse_unittest_output(proc.stderr)
+
+    assert summary["total"] == len(tests) > 0
+    assert summary["passed"] == summary["total"]
+
+
+def test_parse_unittest_output_statuses():
+    """Test unittest statuses are read from the result, not the test name."""
+    output = (
+        "test_lookup (t.T.test_lookup) ... FAIL\n"
+        "test_book (t.T.test_book) ... ERROR\n"
+        "test_skip (t.T.test_skip) ... skipped 'not today'\n"
+        "test_ok (t.T.test_ok) ... ok\n"
+    )
+
+    tests, summary = parse_unittest_output(output)
+
+    assert [t["outcome"] for t in tests] == ["failed", "failed", "skipped", "passed"]
+    assert summary == {"total": 4, "passed": 1, "failed": 2, "skipped": 1}
+
+
+@pytest.mark.asyncio
+async def test_check_unittest_ignores_virtualenv(sandbox: Sandbox):
+    """Test unittest detection only considers project test files."""
+    env = Environment(
+        id="test",
+        runtime_config=python.CONFIG,
+        created_at=datetime.now(timezone.utc),
+        sandbox=sandbox,
+    )
+    site_packages = sandbox.work_dir / ".venv" / "lib" / "site-packages" / "dep"
+    site_packages.mkdir(parents=True)
+    (site_packages / "test_dep.py").write_text("import unittest\n")
+    assert not await check_unittest(env)
+
+    (sandbox.work_dir / "tests").mkdir()
+    (sandbox.work_dir / "tests" / "test_core.py").write_text("import unittest\n")
+    assert await check_unittest(env)
+
+
+def test_parse_pytest_output(fixture_path: Path):
+    """Test parsing real verbose pytest output from the fixture project."""
+    project_dir = fixture_path / "python" / "pytest-project"
+    proc = subprocess.run(
+        [
+            sys.executable, "-m", "pytest", "-v", "--capture=no", "--tb=short",
+            "-p", "no:warnings", "-p", "no:cacheprovider",
+            "-c", "pyproject.toml", "--rootdir", ".",
+        ],
+        cwd=project_dir,
+        env={"PYTHONPATH": str(project_dir / "src")},
+        capture_output=True,
+        text=True,
+    )
+
+    tests, summary = parse_pytest_output(proc.stdout)
+
+    assert summary["total"] == len(tests) > 0
+    assert summary["passed"] == summary["total"]
+    assert "test_mean_calculation" in [t["nodeid"] for t in tests]
+
+
+def test_parse_pytest_output_statuses():
+    """Test pytest statuses are mapped and summary lines are not double counted."""
+    output = (
+        "tests/test_a.py::test_one PASSED                [ 20%]\n"
+        "tests/test_a.py::test_two FAILED                [ 40%]\n"
+        "tests/test_a.py::TestThing::test_three SKIPPED (later) [ 60%]\n"
+        "tests/test_a.py::test_four ERROR                [ 80%]\n"
+        "tests/test_a.py::test_five XFAIL                [ 90%]\n"
+        "tests/test_a.py::test_six SKIPPED (needs PASSED thing)  [100%]\n"
+        "=========================== short test summary info ============================\n"
+        "FAILED tests/test_a.py::test_two - expected PASSED got FAILED\n"
+        "ERROR tests/test_a.py::test_four - RuntimeError\n"
+    )
+
+    tests, summary = parse_pytest_output(output)
+
+    assert [t["nodeid"] for t in tests] == [
+        "test_one", "test_two", "TestThing::test_three", "test_four", "test_five", "test_six"
+    ]
+    assert summary == {"total": 6, "passed": 1, "failed": 2, "skipped": 3}
+
+
+def test_parse_pytest_output_spaced_parametrize_id(tmp_path: Path):
+    """Test parametrize ids containing spaces are parsed from real pytest output."""
+    (tmp_path / "test_p.py").write_text(
+        "import pytest\n\n"
+        "@pytest.mark.parametrize('x', ['a b', 'c'], ids=['a b', 'c'])\n"
+        "def test_p(x):\n"
+        "    pass\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-m", "pytest", "-v", "-p", "no:cacheprovider", "test_p.py"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+
+    tests, summary = parse_pytest_output(proc.stdout)
+
+    assert [t["nodeid"] for t in tests] == ["test_p[a b]", "test_p[c]"]
+    assert summary == {"total": 2, "passed": 2, "failed": 0, "skipped": 0}
+
+
+def test_parse_vitest_coverage_text():
+    """Test the coverage summary is not overwritten by per-file rows."""
+    output = (
+        " % Coverage report from v8\n"
+        "----------|---------|----------|---------|---------|-------------------\n"
+        "File      | % Stmts | % Branch | % Funcs | % Lines | Uncovered Line #s \n"
+        "----------|---------|----------|---------|---------|-------------------\n"
+        "All files |   93.75 |    87.5  |     100 |   91.25 |                   \n"
+        " core.js  |      80 |       50 |      75 |      70 | 12-14             \n"
+        "----------|---------|----------|---------|---------|-------------------\n"
+    )
+
+    coverage = parse_vitest_coverage_text(output)
+
+    assert (coverage.statements, coverage.branches, coverage.functions, coverage.lines) == (
+        93.75, 87.5, 100.0, 91.25
+    )
+    assert coverage.files == {"core.js": 80.0}
+
+    with pytest.raises(ValueError):
+        parse_vitest_coverage_text("no coverage here\n")
+
+
+def test_parse_jest_coverage():
+    """Test Jest hit counts are aggregated into coverage percentages."""
+    coverage = parse_jest_coverage(
+        {
+            "src/a.js": {
+                "s": {"0": 3, "1": 0, "2": 1, "3": 1},
+                "b": {"0": [1, 0], "1": [0, 0]},
+                "f": {"0": 2, "1": 0},
+            },
+            "src/b.js": {"s": {"0": 0}, "b": {}, "f": {}},
+        }
+    )
+
+    assert coverage.statements == 60.0
+    assert coverage.lines == 60.0
+    assert coverage.branches == 50.0
+    assert coverage.functions == 50.0
+    assert coverage.files == {"src/a.js": 75.0, "src/b.js": 0.0}
+
+
+def node_env(sandbox: Sandbox) -> Environment:
+    """Build a Node environment around a sandbox with stub jest and vitest binaries."""
+    for name in ("jest", "vitest"):
+        binary = sandbox.bin_dir / name
+        binary.write_text("#!/bin/sh\n")
+        binary.chmod(0o755)
+    return Environment(
+        id="test",
+        runtime_config=node.CONFIG,
+        created_at=datetime.now(timezone.utc),
+        sandbox=sandbox,
+    )
+
+
+@pytest.mark.asyncio
+async def test_check_js_runners_require_config_file(sandbox: Sandbox):
+    """Test Jest and Vitest are not detected in a project without their config files."""
+    env = node_env(sandbox)
+    (sandbox.work_dir / "package.json").write_text("{}")
+
+    assert not await check_jest(env)
+    assert not await check_vitest(env)
+
+
+@pytest.mark.asyncio
+async def test_check_vitest_accepts_vite_config(sandbox: Sandbox, fixture_path: Path):
+    """Test Vitest is detected from the vite.config.js in the vitest fixture project."""
+    shutil.copytree(
+        fixture_path / "javascript" / "vitest-project", sandbox.work_dir, dirs_exist_ok=True
+    )
+    env = node_env(sandbox)
+
+    assert await check_vitest(env)
+
+
+@pytest.mark.asyncio
+async def test_check_jest_accepts_package_json_config(sandbox: Sandbox):
+    """Test Jest is detected from a "jest" key in package.json alone."""
+    env = node_env(sandbox)
+    (sandbox.work_dir / "package.json").write_text('{"jest": {"testEnvironment": "node"}}')
+
+    assert await check_jest(env)
@@ -0,0 +1,44 @@
+import pytest
+
+from mcp_local_dev.types import Runtime, Sandbox
+from mcp_local_dev.runtimes.runtime import detect_runtime
+
+
+def test_detect_runtime_from_project_file(sandbox: Sandbox):
+    """Test runtime detection from a config file in the project"""
+    (sandbox.work_dir / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+
+    assert detect_runtime(sandbox).name == Runtime.PYTHON
+
+
+@pytest.mark.parametrize("skipped", ["node_modules", ".git", ".venv", "dist"])
+def test_detect_runtime_ignores_vendored_dirs(sandbox: Sandbox, skipped: str):
+    """Test config files inside vendored or build directories are ignored"""
+    nested = sandbox.work_dir / skipped / "dep"
+    nested.mkdir(parents=True)
+    (nested / "package.json").write_text("{}")
+
+    with pytest.raises(ValueError):
+        detect_runtime(sandbox)
+
+
+def test_detect_runtime_prefers_root_config(sandbox: Sandbox):
+    """Test a config file at the project root wins over nested ones"""
+    nested = sandbox.work_dir / "tools"
+    nested.mkdir()
+    (nested / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+    (sandbox.work_dir / "package.json").write_text("{}")
+
+    assert detect_runtime(sandbox).name == Runtime.NODE
+
+
+def test_detect_runtime_tracks_nested_config_changes(sandbox: Sandbox):
+    """Test detection follows changes to nested config files"""
+    nested = sandbox.work_dir / "app"
+    nested.mkdir()
+    (nested / "package.json").write_text("{}")
+    assert detect_runtime(sandbox).name == Runtime.NODE
+
+    (nested / "package.json").unlink()
+    (nested / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+    assert detect_runtime(sandbox).name == Runtime.PYTHON
@@ -3,7 +3,13 @@ import os
 import shutil
 from pathlib import Path
 from mcp_local_dev.types import Sandbox, PackageManager
-from mcp_local_dev.sandboxes.sandbox import run_sandboxed_command, add_package_manager_bin_path
+from mcp_local_dev.sandboxes.commands import install_packages
+from mcp_local_dev.sandboxes.sandbox import (
+    add_package_manager_bin_path,
+    find_host_binary,
+    is_command_available,
+    run_sandboxed_command,
+)
 
 @pytest.mark.asyncio
 async def test_sandbox_isolation(sandbox: Sandbox):
@@ -65,3 +71,91 @@ def test_package_manager_path_order(sandbox: Sandbox):
     
     assert new_path.startswith(str(sandbox.work_dir / ".venv" / "bin"))
     assert original_path in new_path
+
+@pytest.mark.asyncio
+async def test_sandbox_argv_command(sandbox: Sandbox):
+    """Test argv commands run without shell interpretation"""
+    returncode, stdout, _ = await run_sandboxed_command(
+        sandbox, ["echo", "$HOME", "two words"]
+    )
+    assert returncode == 0
+    assert stdout.decode().strip() == "$HOME two words"
+
+
+@pytest.mark.asyncio
+async def test_sandbox_missing_binary_matches_shell(sandbox: Sandbox):
+    """Test a missing binary exits 127 whether run as argv list or shell string"""
+    returncode, stdout, stderr = await run_sandboxed_command(
+        sandbox, ["mcp-missing-tool", "--version"]
+    )
+    assert returncode == 127
+    assert stdout == b""
+    assert b"mcp-missing-tool" in stderr
+
+    returncode, _, _ = await run_sandboxed_command(sandbox, "mcp-missing-tool --version")
+    assert returncode == 127
+
+
+def test_find_host_binary_picks_up_new_installs(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Test a binary installed after a failed lookup is found on the next call"""
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert find_host_binary("late-tool") is None
+
+    tool = tmp_path / "late-tool"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+    assert find_host_binary("late-tool") == str(tool)
+
+    other = tmp_path / "other"
+    other.mkdir()
+    monkeypatch.setenv("PATH", str(other))
+    assert find_host_binary("late-tool") is None
+
+
+def link_host_uv(sandbox: Sandbox) -> None:
+    """Expose the host uv binary inside the sandbox."""
+    (sandbox.bin_dir / "uv").symlink_to(shutil.which("uv"))
+
+
+@pytest.mark.asyncio
+async def test_install_packages_syncs_fixture_project(sandbox: Sandbox, fixture_path: Path):
+    """Test uv installs the pytest fixture project's dependencies into the sandbox"""
+    shutil.copytree(
+        fixture_path / "python" / "pytest-project", sandbox.work_dir, dirs_exist_ok=True
+    )
+    link_host_uv(sandbox)
+
+    await install_packages(sandbox, PackageManager.UV)
+
+    assert (sandbox.work_dir / ".venv" / "bin" / "python").exists()
+
+
+@pytest.mark.asyncio
+async def test_install_packages_reports_failure(sandbox: Sandbox):
+    """Test a failed install surfaces the package manager's output"""
+    link_host_uv(sandbox)
+
+    with pytest.raises(RuntimeError, match="Install failed"):
+        await install_packages(sandbox, PackageManager.UV)
+
+
+@pytest.mark.asyncio
+async def test_install_packages_reports_missing_manager(sandbox: Sandbox):
+    """Test a package manager missing from the sandbox PATH fails like any other install"""
+    sandbox.env_vars["PATH"] = str(sandbox.bin_dir)
+
+    with pytest.raises(RuntimeError, match="Install failed with code 127"):
+        await install_packages(sandbox, PackageManager.BUN)
+
+
+@pytest.mark.asyncio
+async def test_is_command_available_uses_sandbox_path(sandbox: Sandbox):
+    """Test command availability follows the sandbox PATH"""
+    assert not await is_command_available(sandbox, "sandbox-only-tool")
+
+    tool = sandbox.bin_dir / "sandbox-only-tool"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+
+    assert await is_command_available(sandbox, "sandbox-only-tool")
+    assert await is_command_available(sandbox, "sh")
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+
+import pytest
+
+from mcp_local_dev.types import Runtime
+from mcp_local_dev.utils.serialization import encode_json, encode_json_stdlib
+
+
+@dataclass(frozen=True, slots=True)
+class Point:
+    x: int
+    y: int
+
+
+def test_encode_json_backends_agree():
+    """Test orjson and the stdlib fallback serialize dataclasses, datetimes, enums and int keys identically"""
+    pytest.importorskip("orjson")
+    payload = {
+        "point": Point(1, 2),
+        "created": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "day": date(2024, 1, 2),
+        "items": [1, "two", None],
+        "runtime": Runtime.PYTHON,
+        "counts": {1: "one", 2: "two"},
+    }
+
+    assert encode_json(payload) == encode_json_stdlib(payload)
+
+
+def test_encode_json_backends_reject_enum_keys():
+    """Test both backends refuse dict keys the stdlib encoder cannot serialize"""
+    pytest.importorskip("orjson")
+    payload = {Runtime.PYTHON: "python"}
+
+    with pytest.raises(TypeError):
+        encode_json_stdlib(payload)
+    with pytest.raises(TypeError):
+        encode_json(payload)